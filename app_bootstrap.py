@@ -0,0 +1,179 @@
+"""
+Application Bootstrap
+Shared configuration loading, path resolution and logging setup used by the
+main application and the standalone cleanup script
+"""
+
+import sys
+import os
+import logging
+import yaml
+from pathlib import Path
+from console_colors import Fore
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Single formatter instance shared by every handler (building one per handler
+# just duplicates the compiled format spec)
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+def _load_yaml_cached(config_file: Path) -> dict:
+    """
+    Parse a YAML file, caching the result in a pickle sidecar keyed by the
+    source file's (mtime, size). YAML parsing dominates startup time on slow
+    booth machines; unpickling the cached dict on restart skips it entirely.
+    Any cache problem (missing, stale, corrupt, unwritable) silently falls back
+    to a fresh parse.
+    """
+    import pickle
+
+    stat = config_file.stat()
+    cache_key = (stat.st_mtime, stat.st_size)
+    cache_file = config_file.with_suffix(config_file.suffix + '.cache')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == cache_key:
+            return cached_config
+    except Exception:
+        # Corrupt cache bytes can raise more than UnpicklingError (e.g.
+        # AttributeError from a stray GLOBAL opcode); any failure here must
+        # fall through to a fresh parse, never block startup
+        pass
+
+    with open(config_file, 'r') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump((cache_key, config), f)
+    except OSError:
+        pass
+
+    return config
+
+
+def setup_logging(config: dict):
+    """
+    Setup logging configuration.
+    Records are funneled through a QueueHandler so worker and event-handler
+    threads never block on file/console I/O; a background QueueListener does
+    the actual formatting and writing.
+    """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_config = config.get('logging', {})
+    log_level = getattr(logging, log_config.get('level', 'INFO').upper())
+
+    # Setup file handler
+    log_file = log_config.get('file', 'preset_processor.log')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(log_level)
+    file_handler.setFormatter(_LOG_FORMATTER)
+
+    # Setup console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(log_level)
+    console_handler.setFormatter(_LOG_FORMATTER)
+
+    handlers = [file_handler]
+    if log_config.get('console', True):
+        handlers.append(console_handler)
+
+    # Setup root logger: it only enqueues records; the listener thread writes
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def resolve_path(path_str: str, base_dir: Path) -> Path:
+    """
+    Resolve a path string to an absolute Path.
+    If the path is relative, it's resolved relative to base_dir.
+    If the path is absolute, it's used as-is.
+
+    Args:
+        path_str: Path string (can be absolute or relative)
+        base_dir: Base directory for resolving relative paths
+
+    Returns:
+        Resolved absolute Path
+    """
+    path = Path(path_str)
+
+    # If path is already absolute, return it as-is
+    if path.is_absolute():
+        return path
+
+    # Otherwise, join with base_dir and normalize lexically. os.path.normpath is
+    # pure string work - Path.resolve() stats/readlinks every component, which
+    # hangs startup when a configured network drive is slow or unreachable
+    return Path(os.path.normpath(os.path.join(str(base_dir), path_str)))
+
+
+def load_config(config_path: str = 'config.yaml') -> dict:
+    """Load configuration from YAML file"""
+    config_file = Path(config_path).resolve()
+
+    if not config_file.exists():
+        print(f"{Fore.RED}Error: Configuration file not found: {config_path}")
+        print(f"{Fore.YELLOW}Please create a config.yaml file. See README.md for details.")
+        sys.exit(1)
+
+    # Get the directory containing the config file (for resolving relative paths)
+    config_dir = config_file.parent
+
+    try:
+        config = _load_yaml_cached(config_file)
+
+        # Validate required settings
+        required_keys = ['watch_folder']
+        for key in required_keys:
+            if key not in config:
+                print(f"{Fore.RED}Error: Missing required configuration: {key}")
+                sys.exit(1)
+
+        # Resolve paths (support both absolute and relative)
+        if 'watch_folder' in config:
+            config['watch_folder'] = str(resolve_path(config['watch_folder'], config_dir))
+
+        if 'lightroom_watched_folder' in config:
+            config['lightroom_watched_folder'] = str(resolve_path(config['lightroom_watched_folder'], config_dir))
+
+        if 'lightroom_destination_folder' in config:
+            config['lightroom_destination_folder'] = str(resolve_path(config['lightroom_destination_folder'], config_dir))
+
+        # Resolve cleanup folder paths (use normalize_path for Windows compatibility)
+        if 'cleanup' in config and 'folders' in config['cleanup']:
+            from cleanup_old_images import normalize_path
+            resolved_folders = []
+            for folder in config['cleanup']['folders']:
+                # For absolute paths (Windows drives, UNC), use normalize_path
+                # For relative paths, use resolve_path
+                if Path(folder).is_absolute() or (len(folder) >= 2 and folder[1] == ':'):
+                    resolved_folders.append(str(normalize_path(folder)))
+                else:
+                    resolved_folders.append(str(resolve_path(folder, config_dir)))
+            config['cleanup']['folders'] = resolved_folders
+
+        return config
+
+    except yaml.YAMLError as e:
+        print(f"{Fore.RED}Error: Failed to parse configuration file: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"{Fore.RED}Error: Failed to load configuration: {e}")
+        sys.exit(1)
@@ -0,0 +1,49 @@
+"""
+Console Colors
+Raw ANSI escape codes for colored console output, replacing colorama
+"""
+
+import os
+import sys
+import atexit
+
+
+def _reset_terminal():
+    """Write a final reset so error exits don't leave the terminal colored"""
+    try:
+        sys.stdout.write(Style.RESET_ALL)
+        sys.stdout.flush()
+    except (OSError, ValueError):
+        pass  # stdout already closed
+
+
+def enable_vt_mode():
+    """
+    Enable ANSI escape sequence processing in the console.
+
+    On Windows 10+ an empty os.system call flips the console into VT mode
+    natively, so escape codes work without colorama's per-write stdout
+    wrapping. On other platforms terminals speak ANSI already.
+    """
+    if sys.platform == 'win32':
+        os.system('')
+    # The leading-reset color codes only clean up at the *next* colored print,
+    # so a sys.exit right after a colored message (config errors, startup
+    # failures) would otherwise leave the operator's terminal red/yellow -
+    # colorama's autoreset reset after every write
+    atexit.register(_reset_terminal)
+
+
+class Fore:
+    """Foreground color codes (drop-in for colorama.Fore)"""
+    # Each code leads with a reset so consecutive colored prints don't need
+    # explicit Style.RESET_ALL, matching colorama's autoreset=True behavior
+    RED = '\x1b[0m\x1b[31m'
+    GREEN = '\x1b[0m\x1b[32m'
+    YELLOW = '\x1b[0m\x1b[33m'
+    CYAN = '\x1b[0m\x1b[36m'
+
+
+class Style:
+    """Style codes (drop-in for colorama.Style)"""
+    RESET_ALL = '\x1b[0m'
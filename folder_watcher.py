@@ -10,8 +10,9 @@ import os
 from pathlib import Path
 from typing import Set, Dict, Optional
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
-from queue import Queue
+from queue import Queue, Empty
 from threading import Thread, Lock
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,37 @@ def normalize_path(path_str: str) -> Path:
         return Path(path_str)
 
 
+def create_observer(config: Dict) -> Observer:
+    """
+    Create a watchdog observer based on configuration.
+    The default Observer resolves to the native OS notifier (inotify on Linux,
+    ReadDirectoryChangesW on Windows), which delivers events without the
+    per-interval directory scans of the polling backend. PollingObserver remains
+    available via config for filesystems where native events are unreliable
+    (network shares, some mapped drives).
+    """
+    observer_type = config.get('observer', 'native')
+    if observer_type == 'polling':
+        return PollingObserver()
+    return Observer()
+
+
+def _fast_rmtree(path):
+    """
+    Recursively delete a directory tree using a single scandir pass per folder.
+    Cheaper than shutil.rmtree for the small session folders we delete on timeout:
+    scandir entries carry the file type from the directory listing, so we avoid
+    the extra per-entry lstat() and error-hook machinery rmtree performs.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
 class ParentFolderSubfolderHandler(FileSystemEventHandler):
     """Handle file system events for subfolder creation in parent folders"""
     
@@ -97,7 +129,7 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
                     with self.lock:
                         if not self.child_folder_found:
                             self.child_folder_found = True
-                            logger.info(f"Periodic check: Found subfolder in {self.parent_folder_name}: {first_subfolder.name}")
+                            logger.info("Periodic check: Found subfolder in %s: %s", self.parent_folder_name, first_subfolder.name)
                             self.folder_watcher._watch_child_folder_for_images(
                                 str(self.parent_folder_path),
                                 self.parent_folder_name,
@@ -105,10 +137,10 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
                             )
                             return
             except Exception as e:
-                logger.debug(f"Error in periodic subfolder check for {self.parent_folder_name}: {e}")
+                logger.debug("Error in periodic subfolder check for %s: %s", self.parent_folder_name, e)
         
         if not self.child_folder_found:
-            logger.warning(f"Periodic check: No subfolder found in {self.parent_folder_name} after {max_checks * check_interval} seconds")
+            logger.warning("Periodic check: No subfolder found in %s after %s seconds", self.parent_folder_name, max_checks * check_interval)
     
     def on_created(self, event: FileSystemEvent):
         """Called when a new file or directory is created"""
@@ -130,7 +162,7 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
             with self.lock:
                 if not self.child_folder_found:
                     self.child_folder_found = True
-                    logger.info(f"First child folder detected in {self.parent_folder_name}: {folder_path.name}")
+                    logger.info("First child folder detected in %s: %s", self.parent_folder_name, folder_path.name)
                     # Start watching this child folder for images
                     self.folder_watcher._watch_child_folder_for_images(
                         str(self.parent_folder_path),
@@ -138,7 +170,7 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
                         folder_path
                     )
         except Exception as e:
-            logger.debug(f"Error handling subfolder creation in {self.parent_folder_name}: {e}")
+            logger.debug("Error handling subfolder creation in %s: %s", self.parent_folder_name, e)
     
     def on_moved(self, event: FileSystemEvent):
         """Called when a folder is moved/renamed"""
@@ -161,7 +193,7 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
             with self.lock:
                 if not self.child_folder_found:
                     self.child_folder_found = True
-                    logger.info(f"First child folder detected (moved) in {self.parent_folder_name}: {folder_path.name}")
+                    logger.info("First child folder detected (moved) in %s: %s", self.parent_folder_name, folder_path.name)
                     # Start watching this child folder for images
                     self.folder_watcher._watch_child_folder_for_images(
                         str(self.parent_folder_path),
@@ -169,7 +201,7 @@ class ParentFolderSubfolderHandler(FileSystemEventHandler):
                         folder_path
                     )
         except Exception as e:
-            logger.debug(f"Error handling subfolder move in {self.parent_folder_name}: {e}")
+            logger.debug("Error handling subfolder move in %s: %s", self.parent_folder_name, e)
 
 
 class ChildFolderImageHandler(FileSystemEventHandler):
@@ -185,7 +217,16 @@ class ChildFolderImageHandler(FileSystemEventHandler):
         self.lock = Lock()
         self.debounce_seconds = config.get('processing', {}).get('debounce_seconds', 2)
         self.pending_files: Dict[str, float] = {}  # file_path -> timestamp
-        
+
+        # Precompute the supported suffix set once - _is_image_file runs for every
+        # file system event, so rebuilding the extension lists per call adds up
+        supported = config.get('supported_extensions', {})
+        self._known_image_suffixes = frozenset(
+            ext.lower()
+            for ext_list in (supported.get('raw', []), supported.get('standard', []))
+            for ext in ext_list
+        )
+
         # Track existing files when folder watching starts
         self._initialize_existing_files()
         
@@ -204,47 +245,35 @@ class ChildFolderImageHandler(FileSystemEventHandler):
                         try:
                             file_path_str = str(file_path.resolve())
                             existing_files.append(file_path_str)
-                            logger.debug(f"Found existing image in {self.folder_name}: {file_path.name}")
+                            logger.debug("Found existing image in %s: %s", self.folder_name, file_path.name)
                             
                             # Mark as processed to avoid duplicate processing from file system events
                             with self.lock:
                                 self.processed_files.add(file_path_str)
                                 
                         except (OSError, PermissionError) as e:
-                            logger.debug(f"Could not process file {file_path}: {e}")
+                            logger.debug("Could not process file %s: %s", file_path, e)
                             continue
                 
                 # Queue all existing files for processing
                 for file_path_str in existing_files:
-                    logger.info(f"Queueing existing image for processing: {file_path_str}")
-                    logger.debug(f"Queue size before put: {self.image_queue.qsize()}")
+                    logger.info("Queueing existing image for processing: %s", file_path_str)
                     try:
                         self.image_queue.put((self.folder_path, self.folder_name, file_path_str))
-                        logger.info(f"Successfully queued image: {Path(file_path_str).name} (queue size: {self.image_queue.qsize()})")
                     except Exception as e:
-                        logger.error(f"Error queueing image {file_path_str}: {e}", exc_info=True)
-                
+                        logger.error("Error queueing image %s: %s", file_path_str, e, exc_info=True)
+
                 if existing_files:
-                    logger.info(f"Found {len(existing_files)} existing image(s) in {self.folder_name}, queued for processing (final queue size: {self.image_queue.qsize()})")
+                    logger.info("Found %s existing image(s) in %s, queued for processing", len(existing_files), self.folder_name)
                 else:
-                    logger.info(f"No existing images found in {self.folder_name}")
+                    logger.info("No existing images found in %s", self.folder_name)
         except Exception as e:
-            logger.warning(f"Error initializing existing files in {self.folder_name}: {e}")
+            logger.warning("Error initializing existing files in %s: %s", self.folder_name, e)
     
     def _is_image_file(self, file_path: Path) -> bool:
         """Check if file is a supported image file"""
-        ext = file_path.suffix.lower()
-        
-        raw_extensions = [
-            ext.lower() for ext in self.config.get('supported_extensions', {}).get('raw', [])
-        ]
-        standard_extensions = [
-            ext.lower() for ext in self.config.get('supported_extensions', {}).get('standard', [])
-        ]
-        all_extensions = raw_extensions + standard_extensions
-        
-        return ext in all_extensions
-    
+        return file_path.suffix.lower() in self._known_image_suffixes
+
     def on_created(self, event: FileSystemEvent):
         """Called when a new file is created"""
         if event.is_directory:
@@ -253,30 +282,23 @@ class ChildFolderImageHandler(FileSystemEventHandler):
         try:
             file_path = Path(event.src_path).resolve()
             
-            logger.debug(f"on_created event in {self.folder_name}: {file_path.name}")
+            logger.debug("on_created event in %s: %s", self.folder_name, file_path.name)
             
             # Check if it's an image file
             if not self._is_image_file(file_path):
-                logger.debug(f"File {file_path.name} is not an image file, ignoring")
+                logger.debug("File %s is not an image file, ignoring", file_path.name)
                 return
             
             # Check if it's in our watched folder
             if file_path.parent.resolve() != self.folder_path.resolve():
-                logger.debug(f"File {file_path.name} not in watched folder, ignoring")
+                logger.debug("File %s not in watched folder, ignoring", file_path.name)
                 return
             
-            logger.info(f"New image detected in {self.folder_name}: {file_path.name}")
-            
-            with self.lock:
-                file_path_str = str(file_path.resolve())
-                # Check if already processed (from initialization or previous event)
-                if file_path_str not in self.processed_files:
-                    logger.info(f"Adding image to pending queue: {file_path.name}")
-                    self.pending_files[file_path_str] = time.time()
-                else:
-                    logger.debug(f"Image {file_path.name} already processed, skipping")
+            logger.info("New image detected in %s: %s", self.folder_name, file_path.name)
+
+            self._mark_pending(file_path)
         except Exception as e:
-            logger.error(f"Error handling on_created in {self.folder_name}: {e}", exc_info=True)
+            logger.error("Error handling on_created in %s: %s", self.folder_name, e, exc_info=True)
     
     def on_moved(self, event: FileSystemEvent):
         """Called when a file is moved/renamed"""
@@ -286,40 +308,54 @@ class ChildFolderImageHandler(FileSystemEventHandler):
         try:
             # event.dest_path is the new location after move
             file_path = Path(event.dest_path).resolve()
-            
-            logger.debug(f"on_moved event in {self.folder_name}: {file_path.name}, parent: {file_path.parent.resolve()}, watched: {self.folder_path.resolve()}")
+
+            # Guard: the resolve() calls in this message are syscalls we should only
+            # pay when DEBUG logging is actually enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("on_moved event in %s: %s, parent: %s, watched: %s", self.folder_name, file_path.name, file_path.parent.resolve(), self.folder_path.resolve())
             
             # Check if it's in our watched folder
             if file_path.parent.resolve() != self.folder_path.resolve():
-                logger.debug(f"File {file_path.name} not in watched folder, ignoring")
+                logger.debug("File %s not in watched folder, ignoring", file_path.name)
                 return
             
             # Check if it's an image file
             if not self._is_image_file(file_path):
-                logger.debug(f"File {file_path.name} is not an image file, ignoring")
+                logger.debug("File %s is not an image file, ignoring", file_path.name)
                 return
             
-            logger.info(f"Image moved/pasted to {self.folder_name}: {file_path.name}")
-            
-            with self.lock:
-                file_path_str = str(file_path.resolve())
-                # Check if already processed (from initialization or previous event)
-                if file_path_str not in self.processed_files:
-                    logger.info(f"Adding image to pending queue: {file_path.name}")
-                    self.pending_files[file_path_str] = time.time()
-                else:
-                    logger.debug(f"Image {file_path.name} already processed, skipping")
+            logger.info("Image moved/pasted to %s: %s", self.folder_name, file_path.name)
+
+            self._mark_pending(file_path)
         except Exception as e:
-            logger.error(f"Error handling on_moved in {self.folder_name}: {e}", exc_info=True)
+            logger.error("Error handling on_moved in %s: %s", self.folder_name, e, exc_info=True)
     
+    def _mark_pending(self, file_path: Path):
+        """
+        Add a file to the pending queue, deduplicating the multiple events the OS
+        emits for a single new file (e.g. create followed by close-write, or
+        create + moved-to for pasted files). The first event stamps the debounce
+        timestamp; duplicates within the window are dropped without resetting it,
+        so a burst of events cannot postpone processing indefinitely.
+        """
+        with self.lock:
+            file_path_str = str(file_path.resolve())
+            if file_path_str in self.processed_files:
+                logger.debug("Image %s already processed, skipping", file_path.name)
+            elif file_path_str in self.pending_files:
+                logger.debug("Image %s already pending, dropping duplicate event", file_path.name)
+            else:
+                logger.info("Adding image to pending queue: %s", file_path.name)
+                self.pending_files[file_path_str] = time.time()
+
     def _debounce_worker(self):
         """Worker thread that processes files after debounce period"""
         while True:
             time.sleep(0.5)  # Check every 500ms
-            
+
             current_time = time.time()
             files_to_process = []
-            
+
             with self.lock:
                 # Check which files are ready to process
                 for file_path, timestamp in list(self.pending_files.items()):
@@ -328,10 +364,10 @@ class ChildFolderImageHandler(FileSystemEventHandler):
                             files_to_process.append(file_path)
                             self.processed_files.add(file_path)
                         del self.pending_files[file_path]
-            
+
             # Queue files for processing
             for file_path in files_to_process:
-                logger.info(f"Queueing image for processing: {file_path}")
+                logger.info("Queueing image for processing: %s", file_path)
                 self.image_queue.put((self.folder_path, self.folder_name, file_path))
 
 
@@ -376,13 +412,14 @@ class FolderCreatedHandler(FileSystemEventHandler):
                 with self.lock:
                     # Mark all existing child folders as processed
                     self.processed_folders.update(existing_folders)
-                    logger.info(f"Initialized: {len(existing_folders)} existing child folders will be ignored")
+                    logger.info("Initialized: %s existing child folders will be ignored", len(existing_folders))
         except Exception as e:
-            logger.warning(f"Error initializing existing folders: {e}")
+            logger.warning("Error initializing existing folders: %s", e)
     
     def on_created(self, event: FileSystemEvent):
         """Called when a file or directory is created"""
-        logger.debug(f"on_created event: {event.src_path}, is_directory: {event.is_directory}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("on_created event: %s, is_directory: %s", event.src_path, event.is_directory)
         if event.is_directory:
             try:
                 # Resolve the path to handle symlinks and relative paths
@@ -392,20 +429,21 @@ class FolderCreatedHandler(FileSystemEventHandler):
                 
                 # Only process if it's a direct child of the watched folder (not nested, not the watched folder itself)
                 if folder_path_obj.parent.resolve() == watch_path:
-                    logger.info(f"New child folder detected (created): {folder_path}")
+                    logger.info("New child folder detected (created): %s", folder_path)
                     
                     with self.lock:
                         # Check if already processed or pending
                         if folder_path not in self.processed_folders and folder_path not in self.pending_folders:
                             self.pending_folders[folder_path] = time.time()
                         else:
-                            logger.debug(f"Folder already processed or pending: {folder_path}")
+                            logger.debug("Folder already processed or pending: %s", folder_path)
             except Exception as e:
-                logger.debug(f"Error handling on_created: {e}")
+                logger.debug("Error handling on_created: %s", e)
     
     def on_moved(self, event: FileSystemEvent):
         """Called when a file or directory is moved/renamed"""
-        logger.debug(f"on_moved event: {event.src_path} -> {event.dest_path}, is_directory: {event.is_directory}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("on_moved event: %s -> %s, is_directory: %s", event.src_path, event.dest_path, event.is_directory)
         if event.is_directory:
             try:
                 # event.dest_path is the new location after move/paste
@@ -415,16 +453,16 @@ class FolderCreatedHandler(FileSystemEventHandler):
                 
                 # Only process if it's a direct child of the watched folder (not nested, not the watched folder itself)
                 if folder_path_obj.parent.resolve() == watch_path:
-                    logger.info(f"New child folder detected (moved/pasted): {folder_path}")
+                    logger.info("New child folder detected (moved/pasted): %s", folder_path)
                     
                     with self.lock:
                         # Check if already processed or pending
                         if folder_path not in self.processed_folders and folder_path not in self.pending_folders:
                             self.pending_folders[folder_path] = time.time()
                         else:
-                            logger.debug(f"Folder already processed or pending: {folder_path}")
+                            logger.debug("Folder already processed or pending: %s", folder_path)
             except Exception as e:
-                logger.debug(f"Error handling on_moved: {e}")
+                logger.debug("Error handling on_moved: %s", e)
     
     def on_modified(self, event: FileSystemEvent):
         """Called when a directory is modified"""
@@ -440,17 +478,17 @@ class FolderCreatedHandler(FileSystemEventHandler):
                     event_path = Path(event.src_path).resolve()
                     # Only trigger if the modified path is exactly the watched folder
                     if str(event_path) == watch_path_str:
-                        logger.debug(f"Watched folder modified: {event.src_path}")
+                        logger.debug("Watched folder modified: %s", event.src_path)
                         # Check for new subdirectories after a short delay
                         # Use a thread to avoid blocking
                         Thread(target=self._delayed_check, daemon=True).start()
                 except (OSError, ValueError):
                     # If we can't resolve the path, check string match
                     if event.src_path == self.watch_folder or event.src_path == watch_path_str:
-                        logger.debug(f"Watched folder modified (unresolved): {event.src_path}")
+                        logger.debug("Watched folder modified (unresolved): %s", event.src_path)
                         Thread(target=self._delayed_check, daemon=True).start()
         except Exception as e:
-            logger.debug(f"Error in on_modified: {e}")
+            logger.debug("Error in on_modified: %s", e)
     
     def _delayed_check(self):
         """Delayed check for new folders (allows paste operation to complete)"""
@@ -473,7 +511,7 @@ class FolderCreatedHandler(FileSystemEventHandler):
                         resolved_path = str(p.resolve())
                         current_folders.add(resolved_path)
                     except (OSError, PermissionError) as e:
-                        logger.debug(f"Could not resolve path {p}: {e}")
+                        logger.debug("Could not resolve path %s: %s", p, e)
                         continue
             
             with self.lock:
@@ -484,12 +522,12 @@ class FolderCreatedHandler(FileSystemEventHandler):
                 new_folders = {f for f in new_folders if f not in self.pending_folders}
                 
                 if new_folders:
-                    logger.info(f"Found {len(new_folders)} new child folder(s) in watched directory")
+                    logger.info("Found %s new child folder(s) in watched directory", len(new_folders))
                     for folder_path in new_folders:
-                        logger.info(f"New child folder detected: {folder_path}")
+                        logger.info("New child folder detected: %s", folder_path)
                         self.pending_folders[folder_path] = time.time()
         except Exception as e:
-            logger.error(f"Error checking for new folders: {e}", exc_info=True)
+            logger.error("Error checking for new folders: %s", e, exc_info=True)
     
     def _periodic_check(self):
         """Periodically check for new folders (fallback for missed events)"""
@@ -516,7 +554,7 @@ class FolderCreatedHandler(FileSystemEventHandler):
             
             # Queue folders for processing
             for folder_path in folders_to_process:
-                logger.info(f"Queueing folder for watching: {folder_path}")
+                logger.info("Queueing folder for watching: %s", folder_path)
                 self.folder_queue.put(folder_path)
 
 
@@ -530,7 +568,7 @@ class FolderWatcher:
         self.processing_counter = processing_counter
         
         if not self.watch_folder.exists():
-            logger.warning(f"Watch folder does not exist, creating: {watch_folder}")
+            logger.warning("Watch folder does not exist, creating: %s", watch_folder)
             self.watch_folder.mkdir(parents=True, exist_ok=True)
         
         # Folder queue (for new folders to start watching)
@@ -538,12 +576,18 @@ class FolderWatcher:
         
         # Image queue (for new images in watched folders)
         self.image_queue = Queue()
+
+        # Lightroom copy queue (bounded: a full queue applies backpressure to the
+        # image workers instead of buffering unbounded copy work in memory)
+        copy_queue_size = config.get('processing', {}).get('copy_queue_size', 64)
+        self.copy_queue = Queue(maxsize=copy_queue_size)
+        self.copy_thread: Optional[Thread] = None
         
         # Event handler for main watch folder
         self.event_handler = FolderCreatedHandler(self.folder_queue, config, str(self.watch_folder))
         
         # Main observer (watches for new folders)
-        self.observer = Observer()
+        self.observer = create_observer(config)
         self.observer.schedule(
             self.event_handler,
             str(self.watch_folder),
@@ -568,10 +612,14 @@ class FolderWatcher:
         
         # Pending items processing thread (checks for pending items that can be processed)
         self.pending_processor_thread: Optional[Thread] = None
+
+        # Output folders already created this session (skip redundant mkdir syscalls per image)
+        self._created_output_folders: Set[str] = set()
+        self._created_output_folders_lock = Lock()
     
     def start(self):
         """Start watching for new folders"""
-        logger.info(f"Starting folder watcher on: {self.watch_folder}")
+        logger.info("Starting folder watcher on: %s", self.watch_folder)
         
         # Start main observer
         self.observer.start()
@@ -594,6 +642,10 @@ class FolderWatcher:
         # Start pending items processor thread
         self.pending_processor_thread = Thread(target=self._pending_processor_worker, daemon=True, name="PendingProcessor")
         self.pending_processor_thread.start()
+
+        # Start Lightroom copy thread (keeps copy I/O off the image workers)
+        self.copy_thread = Thread(target=self._copy_worker, daemon=True, name="LightroomCopy")
+        self.copy_thread.start()
         
         logger.info("Folder watcher started successfully")
     
@@ -609,7 +661,7 @@ class FolderWatcher:
                     observer.stop()
                     observer.join(timeout=2)
                 except Exception as e:
-                    logger.warning(f"Error stopping observer for {folder_path}: {e}")
+                    logger.warning("Error stopping observer for %s: %s", folder_path, e)
             self.watched_folders.clear()
         
         # Stop main observer
@@ -625,7 +677,10 @@ class FolderWatcher:
         
         if self.pending_processor_thread:
             self.pending_processor_thread.join(timeout=5)
-        
+
+        if self.copy_thread:
+            self.copy_thread.join(timeout=5)
+
         logger.info("Folder watcher stopped")
     
     def _folder_watching_worker(self):
@@ -636,68 +691,68 @@ class FolderWatcher:
                 # Get folder from queue (with timeout to allow checking running flag)
                 try:
                     folder_path = self.folder_queue.get(timeout=1)
-                    logger.info(f"Folder watching worker: Got folder from queue: {folder_path}")
+                    logger.info("Folder watching worker: Got folder from queue: %s", folder_path)
                 except:
                     continue
                 
                 # Start watching this folder for new images
-                logger.info(f"Folder watching worker: Starting to watch folder: {folder_path}")
+                logger.info("Folder watching worker: Starting to watch folder: %s", folder_path)
                 self._start_watching_folder(folder_path)
-                logger.info(f"Folder watching worker: Finished watching folder: {folder_path}")
+                logger.info("Folder watching worker: Finished watching folder: %s", folder_path)
                 
                 # Mark task as done
                 self.folder_queue.task_done()
-                logger.info(f"Folder watching worker: Marked task as done for: {folder_path}")
+                logger.info("Folder watching worker: Marked task as done for: %s", folder_path)
             
             except Exception as e:
-                logger.error(f"Error in folder watching worker: {e}", exc_info=True)
+                logger.error("Error in folder watching worker: %s", e, exc_info=True)
     
     def _start_watching_folder(self, parent_folder_path: str):
         """Start watching a parent folder for the first subfolder created, then watch that subfolder for images"""
-        logger.info(f"_start_watching_folder called with: {parent_folder_path}")
+        logger.info("_start_watching_folder called with: %s", parent_folder_path)
         try:
             parent_folder = Path(parent_folder_path)
-            logger.info(f"Created Path object: {parent_folder}")
+            logger.info("Created Path object: %s", parent_folder)
             
             if not parent_folder.exists() or not parent_folder.is_dir():
-                logger.warning(f"Parent folder does not exist or is not a directory: {parent_folder_path}")
+                logger.warning("Parent folder does not exist or is not a directory: %s", parent_folder_path)
                 return
             
             parent_folder_name = parent_folder.name
-            logger.info(f"Starting to watch parent folder for first subfolder: {parent_folder_name}")
-            logger.info(f"Parent folder path: {parent_folder}")
-            logger.info(f"Parent folder exists: {parent_folder.exists()}, is_dir: {parent_folder.is_dir()}")
+            logger.info("Starting to watch parent folder for first subfolder: %s", parent_folder_name)
+            logger.info("Parent folder path: %s", parent_folder)
+            logger.info("Parent folder exists: %s, is_dir: %s", parent_folder.exists(), parent_folder.is_dir())
             
             # Check if there's already a subfolder (with retry for pasted folders)
-            logger.info(f"Checking for existing subfolders in {parent_folder_name}")
+            logger.info("Checking for existing subfolders in %s", parent_folder_name)
             existing_subfolders = []
             for attempt in range(3):  # Try 3 times with delays
                 try:
                     existing_subfolders = [p for p in parent_folder.iterdir() if p.is_dir()]
-                    logger.info(f"Attempt {attempt + 1}: Found {len(existing_subfolders)} subfolder(s) in {parent_folder_name}")
+                    logger.info("Attempt %s: Found %s subfolder(s) in %s", attempt + 1, len(existing_subfolders), parent_folder_name)
                     if existing_subfolders:
                         break
                     if attempt < 2:  # Don't sleep on last attempt
                         time.sleep(0.5)  # Wait 500ms before retry
                 except (OSError, PermissionError) as e:
-                    logger.warning(f"Error checking for subfolders (attempt {attempt + 1}): {e}")
+                    logger.warning("Error checking for subfolders (attempt %s): %s", attempt + 1, e)
                     if attempt < 2:
                         time.sleep(0.5)
             
             if existing_subfolders:
                 # Use the first existing subfolder
                 first_subfolder = existing_subfolders[0]
-                logger.info(f"Found existing subfolder in {parent_folder_name}: {first_subfolder.name}")
-                logger.info(f"Subfolder path: {first_subfolder}")
-                logger.info(f"Calling _watch_child_folder_for_images for {parent_folder_name}")
+                logger.info("Found existing subfolder in %s: %s", parent_folder_name, first_subfolder.name)
+                logger.info("Subfolder path: %s", first_subfolder)
+                logger.info("Calling _watch_child_folder_for_images for %s", parent_folder_name)
                 self._watch_child_folder_for_images(parent_folder_path, parent_folder_name, first_subfolder)
-                logger.info(f"Returning from _start_watching_folder after watching child folder")
+                logger.info("Returning from _start_watching_folder after watching child folder")
                 return
             else:
-                logger.info(f"No existing subfolders found in {parent_folder_name}, will watch for creation")
+                logger.info("No existing subfolders found in %s, will watch for creation", parent_folder_name)
         
             # No subfolder exists yet, watch for the first one to be created
-            logger.info(f"Creating subfolder handler for {parent_folder_name}")
+            logger.info("Creating subfolder handler for %s", parent_folder_name)
             # Create handler to watch for subfolder creation
             subfolder_handler = ParentFolderSubfolderHandler(
                 parent_folder_path,
@@ -705,35 +760,35 @@ class FolderWatcher:
                 self,
                 self.config
             )
-            logger.info(f"Subfolder handler created for {parent_folder_name}")
+            logger.info("Subfolder handler created for %s", parent_folder_name)
             
             # Create observer for the parent folder (to detect subfolder creation)
-            observer = Observer()
+            observer = create_observer(self.config)
             observer.schedule(subfolder_handler, str(parent_folder), recursive=False)
             observer.start()
-            logger.info(f"Observer started for {parent_folder_name}")
+            logger.info("Observer started for %s", parent_folder_name)
             
             # Track using parent folder path
             created_time = time.time()
             with self.watched_folders_lock:
                 self.watched_folders[parent_folder_path] = (observer, subfolder_handler, created_time)
             
-            logger.info(f"Now watching parent folder {parent_folder_name} for first subfolder creation")
-            logger.info(f"_start_watching_folder completed successfully for {parent_folder_name}")
+            logger.info("Now watching parent folder %s for first subfolder creation", parent_folder_name)
+            logger.info("_start_watching_folder completed successfully for %s", parent_folder_name)
         
         except Exception as e:
-            logger.error(f"Error in _start_watching_folder for {parent_folder_path}: {e}", exc_info=True)
+            logger.error("Error in _start_watching_folder for %s: %s", parent_folder_path, e, exc_info=True)
     
     def _watch_child_folder_for_images(self, parent_folder_path: str, parent_folder_name: str, child_folder_path: Path):
         """Watch the child folder for images, using parent folder name for processing"""
         try:
             if not child_folder_path.exists() or not child_folder_path.is_dir():
-                logger.warning(f"Child folder does not exist or is not a directory: {child_folder_path}")
+                logger.warning("Child folder does not exist or is not a directory: %s", child_folder_path)
                 return
             
-            logger.info(f"Starting to watch child folder '{child_folder_path.name}' for images in parent: {parent_folder_name}")
-            logger.info(f"Child folder path: {child_folder_path}")
-            logger.info(f"Child folder exists: {child_folder_path.exists()}, is_dir: {child_folder_path.is_dir()}")
+            logger.info("Starting to watch child folder '%s' for images in parent: %s", child_folder_path.name, parent_folder_name)
+            logger.info("Child folder path: %s", child_folder_path)
+            logger.info("Child folder exists: %s, is_dir: %s", child_folder_path.exists(), child_folder_path.is_dir())
             
             # Stop any existing observer for this parent folder (if watching for subfolder creation)
             with self.watched_folders_lock:
@@ -742,22 +797,22 @@ class FolderWatcher:
                     try:
                         old_observer.stop()
                         old_observer.join(timeout=1)
-                        logger.debug(f"Stopped old observer for {parent_folder_name}")
+                        logger.debug("Stopped old observer for %s", parent_folder_name)
                     except Exception as e:
-                        logger.debug(f"Error stopping old observer: {e}")
+                        logger.debug("Error stopping old observer: %s", e)
             
             # Create image handler for the child folder, but use parent folder name
-            logger.info(f"Creating image handler for child folder: {child_folder_path}")
+            logger.info("Creating image handler for child folder: %s", child_folder_path)
             image_handler = ChildFolderImageHandler(
                 str(child_folder_path),
                 parent_folder_name,  # Use parent folder name, not child folder name
                 self.image_queue,
                 self.config
             )
-            logger.info(f"Image handler created successfully for {parent_folder_name}")
+            logger.info("Image handler created successfully for %s", parent_folder_name)
             
             # Create observer for the child folder
-            observer = Observer()
+            observer = create_observer(self.config)
             observer.schedule(image_handler, str(child_folder_path), recursive=False)
             observer.start()
             
@@ -766,10 +821,10 @@ class FolderWatcher:
             with self.watched_folders_lock:
                 self.watched_folders[parent_folder_path] = (observer, image_handler, created_time)
             
-            logger.info(f"Now watching child folder '{child_folder_path.name}' for images (using parent name: {parent_folder_name})")
+            logger.info("Now watching child folder '%s' for images (using parent name: %s)", child_folder_path.name, parent_folder_name)
             
         except Exception as e:
-            logger.error(f"Error watching child folder {child_folder_path}: {e}", exc_info=True)
+            logger.error("Error watching child folder %s: %s", child_folder_path, e, exc_info=True)
     
     def _stop_watching_folder(self, folder_path: str):
         """Stop watching a folder and delete it"""
@@ -795,13 +850,13 @@ class FolderWatcher:
             folder = Path(folder_path)
             if folder.exists():
                 try:
-                    shutil.rmtree(folder)
-                    logger.info(f"Deleted folder after timeout: {folder_path}")
+                    _fast_rmtree(folder)
+                    logger.info("Deleted folder after timeout: %s", folder_path)
                 except Exception as e:
-                    logger.warning(f"Error deleting folder {folder_path}: {e}")
+                    logger.warning("Error deleting folder %s: %s", folder_path, e)
             
         except Exception as e:
-            logger.error(f"Error stopping watch for folder {folder_path}: {e}", exc_info=True)
+            logger.error("Error stopping watch for folder %s: %s", folder_path, e, exc_info=True)
     
     def _folder_management_worker(self):
         """Worker thread that manages folder timeouts and cleanup"""
@@ -820,11 +875,11 @@ class FolderWatcher:
                 
                 # Stop watching and delete folders that have timed out
                 for folder_path in folders_to_remove:
-                    logger.info(f"Folder timeout reached: {folder_path} (age: {age_seconds/60:.1f} minutes)")
+                    logger.info("Folder timeout reached: %s (age: %.1f minutes)", folder_path, age_seconds/60)
                     self._stop_watching_folder(folder_path)
             
             except Exception as e:
-                logger.error(f"Error in folder management worker: {e}", exc_info=True)
+                logger.error("Error in folder management worker: %s", e, exc_info=True)
     
     def _image_processing_worker(self):
         """Worker thread that processes individual images"""
@@ -834,11 +889,14 @@ class FolderWatcher:
                 # Get image from queue (with timeout to allow checking running flag)
                 try:
                     folder_path, folder_name, image_path = self.image_queue.get(timeout=1)
-                    logger.info(f"Got image from queue: {Path(image_path).name} for folder: {folder_name} (queue size: {self.image_queue.qsize()})")
+                    image_name = Path(image_path).name
+                    # Note: no qsize() here - it takes the queue's internal mutex and
+                    # would serialize against producers on every dequeue
+                    logger.info("Got image from queue: %s for folder: %s", image_name, folder_name)
                 except Exception as queue_exception:
                     # Queue timeout (expected) or other exception
                     if "Empty" not in str(type(queue_exception).__name__):
-                        logger.debug(f"Queue get exception: {type(queue_exception).__name__}: {queue_exception}")
+                        logger.debug("Queue get exception: %s: %s", type(queue_exception).__name__, queue_exception)
                     # Check for pending items that can now be processed
                     self._process_pending_items()
                     continue
@@ -847,18 +905,25 @@ class FolderWatcher:
                 if not self.processing_counter.can_process(folder_name):
                     # Threshold exceeded, add to pending queue
                     logger.info(
-                        f"Processing threshold exceeded for {folder_name} "
-                        f"(count: {self.processing_counter.get_count(folder_name)}), "
-                        f"holding image: {Path(image_path).name}"
+                        "Processing threshold exceeded for %s (count: %s), holding image: %s",
+                        folder_name, self.processing_counter.get_count(folder_name), image_name
                     )
-                    self.processing_counter.add_pending(folder_name, (folder_path, folder_name, image_path))
+                    item = (folder_path, folder_name, image_path)
+                    while not self.processing_counter.add_pending(folder_name, item):
+                        # Pending queue at capacity: stop draining image_queue
+                        # until a decrement frees room instead of buffering
+                        # without bound (natural back-pressure on producers)
+                        if not self.running:
+                            break
+                        self.processing_counter.capacity_event.wait(timeout=1)
+                        self._process_pending_items()
                     self.image_queue.task_done()
                     continue
                 
                 # Process the image
-                logger.debug(f"About to process image: {Path(image_path).name} for folder: {folder_name}")
+                logger.debug("About to process image: %s for folder: %s", image_name, folder_name)
                 self._process_image(folder_path, folder_name, image_path)
-                logger.debug(f"Finished processing image: {Path(image_path).name} for folder: {folder_name}")
+                logger.debug("Finished processing image: %s for folder: %s", image_name, folder_name)
                 
                 # Mark task as done
                 self.image_queue.task_done()
@@ -867,33 +932,60 @@ class FolderWatcher:
                 self._process_pending_items()
             
             except Exception as e:
-                logger.error(f"Error in image processing worker: {e}", exc_info=True)
+                logger.error("Error in image processing worker: %s", e, exc_info=True)
     
     def _process_pending_items(self):
         """Process pending items for all folders that are below threshold"""
-        # Get all folder names from watched folders
+        # Get all folder names from watched folders (deduplicated in one pass)
         with self.watched_folders_lock:
-            folder_names = [Path(f).name for f in self.watched_folders.keys()]
-        
-        # Check each folder for pending items
-        for folder_name in folder_names:
-            while (self.processing_counter.can_process(folder_name) and 
-                   self.processing_counter.has_pending(folder_name)):
-                pending_item = self.processing_counter.get_pending(folder_name)
-                if pending_item:
-                    folder_path, folder_name, image_path = pending_item
-                    logger.info(f"Processing pending image for {folder_name}: {Path(image_path).name}")
-                    self._process_image(folder_path, folder_name, image_path)
+            folder_names = {Path(f).name for f in self.watched_folders.keys()}
+
+        if not folder_names:
+            return
+
+        # Drain everything that fits under the threshold in one counter lock
+        # acquisition instead of a can_process/has_pending/get_pending round
+        # trip per item
+        for pending_item in self.processing_counter.drain_processable(folder_names):
+            folder_path, folder_name, image_path = pending_item
+            logger.info("Processing pending image for %s: %s", folder_name, Path(image_path).name)
+            self._process_image(folder_path, folder_name, image_path)
     
     def _pending_processor_worker(self):
-        """Worker thread that periodically checks for pending items that can be processed"""
+        """Worker thread that processes pending items as soon as capacity frees up"""
         while self.running:
             try:
-                time.sleep(2)  # Check every 2 seconds
+                # Woken by ProcessingCounter.decrement when a folder with pending
+                # items drops below threshold; the timeout is only a safety net
+                if self.processing_counter.capacity_event.wait(timeout=2):
+                    self.processing_counter.capacity_event.clear()
                 self._process_pending_items()
             except Exception as e:
-                logger.error(f"Error in pending processor worker: {e}", exc_info=True)
+                logger.error("Error in pending processor worker: %s", e, exc_info=True)
     
+    def _ensure_folder(self, folder: Path):
+        """Create a folder if we haven't already created/verified it this session"""
+        folder_key = str(folder)
+        with self._created_output_folders_lock:
+            if folder_key in self._created_output_folders:
+                return
+        folder.mkdir(parents=True, exist_ok=True)
+        with self._created_output_folders_lock:
+            self._created_output_folders.add(folder_key)
+
+    def _forget_folder(self, folder: Path):
+        """Evict a folder from the created-folders cache (after a failed move/copy)"""
+        with self._created_output_folders_lock:
+            self._created_output_folders.discard(str(folder))
+
+    @staticmethod
+    def _move_file(source: Path, destination: Path):
+        """Move a file, preferring a single-syscall rename over shutil.move"""
+        try:
+            os.replace(str(source), str(destination))
+        except OSError:
+            shutil.move(str(source), str(destination))
+
     def _process_image(self, folder_path, folder_name: str, image_path: str):
         """Process a single image: move original to output, copy renamed to Lightroom"""
         try:
@@ -901,23 +993,23 @@ class FolderWatcher:
             if isinstance(folder_path, str):
                 folder_path = Path(folder_path)
             elif not isinstance(folder_path, Path):
-                logger.error(f"Invalid folder_path type: {type(folder_path)}")
+                logger.error("Invalid folder_path type: %s", type(folder_path))
                 return
             
             image_file = Path(image_path)
             
             if not image_file.exists():
-                logger.warning(f"Image file no longer exists: {image_path}")
+                logger.warning("Image file no longer exists: %s", image_path)
                 return
             
-            logger.info(f"Processing image: {image_file.name} from folder: {folder_name}")
-            logger.debug(f"Image path: {image_path}, Folder path: {folder_path}")
+            logger.info("Processing image: %s from folder: %s", image_file.name, folder_name)
+            logger.debug("Image path: %s, Folder path: %s", image_path, folder_path)
             
             # Get output base folder (normalize Windows paths)
             output_base_str = self.config.get('output_base_folder', '../output')
             output_base = normalize_path(output_base_str)
             
-            logger.debug(f"Output base folder: {output_base} (normalized from: {output_base_str})")
+            logger.debug("Output base folder: %s (normalized from: %s)", output_base, output_base_str)
             
             # Check if folder already exists (checked at startup)
             output_base_exists = self.config.get('_output_base_exists', False)
@@ -926,10 +1018,10 @@ class FolderWatcher:
                 # Folder exists, just verify accessibility
                 try:
                     list(output_base.iterdir())
-                    logger.debug(f"Output base folder exists and is accessible: {output_base}")
+                    logger.debug("Output base folder exists and is accessible: %s", output_base)
                 except (OSError, PermissionError) as e:
-                    logger.error(f"Output base folder exists but is not accessible: {e}")
-                    logger.error(f"Original path string: {output_base_str}")
+                    logger.error("Output base folder exists but is not accessible: %s", e)
+                    logger.error("Original path string: %s", output_base_str)
                     return
             else:
                 # Folder doesn't exist, try to create it
@@ -941,10 +1033,10 @@ class FolderWatcher:
                     # Not a root drive, try to create the base folder
                     try:
                         # output_base.mkdir(parents=True, exist_ok=True)
-                        logger.debug(f"Output base folder created: {output_base}")
+                        logger.debug("Output base folder created: %s", output_base)
                     except (OSError, PermissionError) as e:
-                        logger.error(f"Cannot create output folder {output_base}: {e}")
-                        logger.error(f"Original path string: {output_base_str}")
+                        logger.error("Cannot create output folder %s: %s", output_base, e)
+                        logger.error("Original path string: %s", output_base_str)
                         return
                 else:
                     # Root drive - verify it exists/accessible by trying to list it
@@ -953,46 +1045,92 @@ class FolderWatcher:
                         # Try to access the root drive by checking if we can get its parent (which should be the drive itself)
                         # Or try to list it
                         list(output_base.iterdir())
-                        logger.debug(f"Root drive {output_base} is accessible")
+                        logger.debug("Root drive %s is accessible", output_base)
                     except (OSError, PermissionError) as e:
-                        logger.error(f"Root drive {output_base} is not accessible: {e}")
-                        logger.error(f"Original path string: {output_base_str}")
-                        logger.error(f"Please ensure the drive is mapped and accessible, or use a subdirectory like 'Z:/output'")
+                        logger.error("Root drive %s is not accessible: %s", output_base, e)
+                        logger.error("Original path string: %s", output_base_str)
+                        logger.error("Please ensure the drive is mapped and accessible, or use a subdirectory like 'Z:/output'")
                         return
             
             # Create output folder structure: output_base/folder_name/ (for original images)
+            # Only hit the filesystem once per folder per session - repeated mkdir calls
+            # cost a syscall per image even with exist_ok=True
             output_folder = output_base / folder_name
-            output_folder.mkdir(parents=True, exist_ok=True)
-            
+            self._ensure_folder(output_folder)
+
             # Move original image to output folder (not in processed subfolder)
+            # Try a plain rename first (single syscall when source and destination are
+            # on the same volume); fall back to shutil.move for cross-device moves
             original_destination = output_folder / image_file.name
             try:
-                shutil.move(str(image_file), str(original_destination))
-                logger.info(f"Moved original image: {image_file.name} -> {original_destination}")
+                try:
+                    self._move_file(image_file, original_destination)
+                except (OSError, shutil.Error):
+                    # The cached folder may have been deleted behind us (cleanup
+                    # rmtree, operator clearing the output drive); recreate it
+                    # and retry once before giving up on the image
+                    self._forget_folder(output_folder)
+                    self._ensure_folder(output_folder)
+                    self._move_file(image_file, original_destination)
+                logger.info("Moved original image: %s -> %s", image_file.name, original_destination)
             except Exception as e:
-                logger.error(f"Error moving original image {image_file.name}: {e}", exc_info=True)
+                logger.error("Error moving original image %s: %s", image_file.name, e, exc_info=True)
                 return
-            
+
             # Create new name with folder prefix for Lightroom
             # Use separator to reliably separate folder name from filename
             separator = self.config.get('filename_separator', '___')
             new_name = f"{folder_name}{separator}{image_file.name}"
-            
+
             # Copy to lightroom watched folder with new name
             lightroom_watched = Path(self.config.get('lightroom_watched_folder', '../lightroom_watched'))
-            lightroom_watched.mkdir(parents=True, exist_ok=True)
+            self._ensure_folder(lightroom_watched)
             lightroom_destination = lightroom_watched / new_name
             
+            # Count the image against the threshold as soon as it is committed to
+            # Lightroom: incrementing only after the copy completes would let the
+            # worker's threshold check lag by the whole copy backlog during bursts
+            count = self.processing_counter.increment(folder_name)
+            logger.debug("Processing counter for %s: %s/%s", folder_name, count, self.processing_counter.threshold)
+
+            # Hand the copy to the dedicated I/O thread so this worker can pick up
+            # the next image; put() blocks if the copy backlog is full
+            self.copy_queue.put((original_destination, lightroom_destination, folder_name))
+
+        except Exception as e:
+            logger.error("Error processing image %s: %s", image_path, e, exc_info=True)
+
+    def _copy_worker(self):
+        """Worker thread that copies moved originals into the Lightroom watched folder"""
+        logger.debug("Lightroom copy worker started")
+        # Keep draining after stop(): jobs still queued are already committed
+        # (original moved out of the session folder, counter incremented), so
+        # abandoning them would silently lose the Lightroom copy
+        while self.running or not self.copy_queue.empty():
             try:
-                shutil.copy2(str(original_destination), str(lightroom_destination))
-                logger.info(f"Copied to Lightroom watched: {image_file.name} -> {new_name}")
-                
-                # Increment processing counter (image sent to lightroom)
-                count = self.processing_counter.increment(folder_name)
-                logger.debug(f"Processing counter for {folder_name}: {count}/{self.processing_counter.threshold}")
-                
+                # Get copy job from queue (with timeout to allow checking running flag)
+                try:
+                    source, lightroom_destination, folder_name = self.copy_queue.get(timeout=1)
+                except Empty:
+                    continue
+
+                try:
+                    try:
+                        shutil.copy2(str(source), str(lightroom_destination))
+                    except (OSError, shutil.Error):
+                        # The cached watched folder may have been deleted
+                        # mid-run; recreate it and retry once
+                        self._forget_folder(lightroom_destination.parent)
+                        self._ensure_folder(lightroom_destination.parent)
+                        shutil.copy2(str(source), str(lightroom_destination))
+                    logger.info("Copied to Lightroom watched: %s -> %s", source.name, lightroom_destination.name)
+                except Exception as e:
+                    logger.error("Error copying to Lightroom watched %s: %s", source.name, e, exc_info=True)
+                    # The image never reached Lightroom, so release its slot
+                    # (it was counted when the copy job was enqueued)
+                    self.processing_counter.decrement(folder_name)
+
+                self.copy_queue.task_done()
+
             except Exception as e:
-                logger.error(f"Error copying to Lightroom watched {image_file.name}: {e}", exc_info=True)
-        
-        except Exception as e:
-            logger.error(f"Error processing image {image_path}: {e}", exc_info=True)
+                logger.error("Error in Lightroom copy worker: %s", e, exc_info=True)
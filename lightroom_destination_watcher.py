@@ -6,118 +6,364 @@ Monitors Lightroom destination folder for processed images and moves them back t
 import time
 import logging
 import shutil
+import os
 from pathlib import Path
-from typing import Set, Dict
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
-from queue import Queue
-from threading import Thread, Lock
+from typing import Dict
+from watchdog.events import PatternMatchingEventHandler, FileSystemEvent
+from folder_watcher import create_observer, normalize_path
+from queue import Empty
+from collections import deque
+from functools import lru_cache
+from threading import Thread, Lock, Event
 
 logger = logging.getLogger(__name__)
 
+# Sentinel pushed onto the processor queue to wake and stop a worker
+_SHUTDOWN = object()
 
-class LightroomDestinationHandler(FileSystemEventHandler):
-    """Handle file system events in Lightroom destination folder"""
-    
-    def __init__(self, processor_queue: Queue, config: Dict, destination_folder: str, watch_folder: str):
-        super().__init__()
+
+class DequeChannel:
+    """
+    Minimal producer/consumer channel backed by collections.deque.
+    deque.append/popleft are atomic under the GIL, so producers never take a
+    lock: put() is an append plus an Event set. Consumers only touch the Event
+    when the deque is empty, unlike queue.Queue which acquires its mutex and
+    notifies a condition on every put/get.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._event = Event()
+
+    def put(self, item):
+        self._items.append(item)
+        self._event.set()
+
+    def get(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            # Re-check after clearing so a put() racing with the clear is not missed
+            self._event.clear()
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise Empty
+            if not self._event.wait(timeout=remaining):
+                raise Empty
+
+    def __len__(self):
+        return len(self._items)
+
+
+class TTLSet:
+    """
+    Set whose members expire after a fixed time-to-live.
+    Bounds the processed-files bookkeeping on long-running booths: entries only
+    need to outlive the window in which the OS might replay events for a file
+    (the file itself is moved out of the folder), not the whole process
+    lifetime. Membership checks are GIL-atomic dict reads.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._expiry: Dict[str, float] = {}  # key -> expiry timestamp
+        self._last_prune = time.time()
+
+    def add(self, key: str):
+        self._expiry[key] = time.time() + self.ttl_seconds
+
+    def update(self, keys):
+        expiry = time.time() + self.ttl_seconds
+        for key in keys:
+            self._expiry[key] = expiry
+
+    def __contains__(self, key: str) -> bool:
+        expiry = self._expiry.get(key)
+        return expiry is not None and expiry > time.time()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def __iter__(self):
+        return iter(list(self._expiry))
+
+    def prune(self, interval: float = 60.0):
+        """Drop expired entries (rate-limited; call opportunistically)"""
+        now = time.time()
+        if now - self._last_prune < interval:
+            return
+        self._last_prune = now
+        for key in [k for k, expiry in list(self._expiry.items()) if expiry <= now]:
+            self._expiry.pop(key, None)
+
+
+@lru_cache(maxsize=256)
+def _ensure_output_folder(folder_key: str):
+    """
+    makedirs once per distinct output folder. lru_cache gives us the bounded
+    thread-safe memoization for free - repeat calls for a known folder never
+    reach the filesystem.
+    """
+    os.makedirs(folder_key, exist_ok=True)
+
+
+def _move_to_output(src: str, dst: str):
+    """Move a file, preferring a single-syscall rename over a cross-device copy"""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        _cross_device_move(src, dst)
+
+
+def _cross_device_move(src: str, dst: str):
+    """
+    Move a file across volumes. Uses os.copy_file_range where available
+    (Linux 5.3+) so the bytes are copied in-kernel instead of shuttling through
+    a Python read/write loop; falls back to shutil.move (which itself uses
+    sendfile on Linux) everywhere else.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            os.unlink(src)
+            return
+        except OSError:
+            # Kernel/filesystem does not support the cross-device copy; clean up
+            # any partial destination and use the portable path
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    shutil.move(src, dst)
+
+
+def _same_volume(path_a: str, path_b: str) -> bool:
+    """
+    Best-effort check whether two paths live on the same volume (so a move
+    between them is a rename, not a copy). Walks up to the nearest existing
+    ancestor of each path and compares device ids; on Windows falls back to
+    comparing drive/UNC share prefixes.
+    """
+    try:
+        if os.name == 'nt':
+            drive_a = os.path.splitdrive(os.path.abspath(path_a))[0]
+            drive_b = os.path.splitdrive(os.path.abspath(path_b))[0]
+            return bool(drive_a) and os.path.normcase(drive_a) == os.path.normcase(drive_b)
+
+        def existing_ancestor(path):
+            path = os.path.abspath(path)
+            while path and not os.path.exists(path):
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+            return path
+
+        return os.stat(existing_ancestor(path_a)).st_dev == os.stat(existing_ancestor(path_b)).st_dev
+    except OSError:
+        return False
+
+
+class LightroomDestinationHandler(PatternMatchingEventHandler):
+    """
+    Handle file system events in Lightroom destination folder.
+    Extends PatternMatchingEventHandler so non-image files and directory events
+    are dropped inside watchdog's dispatch, before our callbacks run at all.
+    """
+
+    def __init__(self, processor_queue: DequeChannel, config: Dict, destination_folder: str, watch_folder: str):
+        supported = config.get('supported_extensions', {})
+        image_suffixes = frozenset(
+            ext.lower()
+            for ext_list in (supported.get('raw', []), supported.get('standard', []))
+            for ext in ext_list
+        )
+        super().__init__(
+            patterns=[f"*{ext}" for ext in sorted(image_suffixes)],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
+        self._known_image_suffixes = image_suffixes
         self.processor_queue = processor_queue
         self.config = config
         self.destination_folder = destination_folder
+        # Canonical string key for the destination, computed once. Event handlers
+        # canonicalize paths with normcase(abspath(...)) - pure string work, no
+        # per-event stat/readlink syscalls like Path.resolve()
+        self._destination_key = os.path.normcase(os.path.abspath(destination_folder))
         # watch_folder parameter kept for API compatibility but not used
         self.pending_files: Dict[str, float] = {}  # file_path -> timestamp
-        self.processed_files: Set[str] = set()
+        # Time-bounded: processed entries only matter while the OS could still
+        # replay events for them, so let them expire instead of growing forever
+        processed_ttl_minutes = config.get('processing', {}).get('processed_ttl_minutes', 60)
+        self.processed_files = TTLSet(ttl_seconds=processed_ttl_minutes * 60)
         self.lock = Lock()
         self.debounce_seconds = config.get('processing', {}).get('debounce_seconds', 2)
-        
-        # Track existing files when app starts (to avoid processing old files)
-        self._initialize_existing_files()
+        # Wakes the debounce worker when a new file arrives, so it can sleep
+        # until the next deadline instead of polling every 500ms
+        self._pending_event = Event()
+
+        # Append-only journal of processed file keys, so a restart restores the
+        # processed set instead of relying solely on re-scanning the folder
+        self._journal_path = config.get('processing', {}).get('processed_journal', 'processed_files.journal')
+        self._journal_file = None
+        self._journal_restored = False
+        self._load_journal()
+
+        # Track existing files when app starts (to avoid processing old files).
+        # A restored journal already scanned the folder, so skip the second walk
+        if not self._journal_restored:
+            self._initialize_existing_files()
         
         # Start debounce thread
         self.debounce_thread = Thread(target=self._debounce_worker, daemon=True)
         self.debounce_thread.start()
     
+    @staticmethod
+    def _canonical(path_str: str) -> str:
+        """Canonical string key for a path (no filesystem syscalls)"""
+        return os.path.normcase(os.path.abspath(path_str))
+
+    def _load_journal(self):
+        """Restore the processed set from the journal and open it for appends"""
+        if not self._journal_path:
+            return
+        try:
+            if os.path.exists(self._journal_path):
+                with open(self._journal_path, 'r', encoding='utf-8') as f:
+                    restored = {line.rstrip('\n') for line in f if line.rstrip('\n')}
+                # Compact against the folder: a key whose file is no longer in
+                # the destination can never fire an event again, so carrying it
+                # across restarts only grows the journal and the in-memory set
+                restored &= self._scan_destination_keys()
+                if restored:
+                    logger.info("Restored %s processed file(s) from journal", len(restored))
+                with open(self._journal_path, 'w', encoding='utf-8') as f:
+                    f.writelines(key + '\n' for key in restored)
+                # The journal is the source of truth for what was processed:
+                # files sitting in the destination without a journal entry were
+                # never handled, so they stay eligible (unlike the blanket
+                # ignore _initialize_existing_files applies when no journal exists)
+                with self.lock:
+                    self.processed_files.update(restored)
+                self._journal_restored = True
+            self._journal_file = open(self._journal_path, 'a', encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not open processed-files journal %s: %s", self._journal_path, e)
+            self._journal_file = None
+
+    def _journal_append(self, file_keys):
+        """Append newly processed file keys to the journal (best effort)"""
+        if not self._journal_file or not file_keys:
+            return
+        try:
+            self._journal_file.writelines(key + '\n' for key in file_keys)
+            self._journal_file.flush()
+        except OSError as e:
+            logger.warning("Could not append to processed-files journal: %s", e)
+
+    def _scan_destination_keys(self) -> set:
+        """One scandir pass over the destination folder, returning canonical keys"""
+        keys = set()
+        if not os.path.isdir(self.destination_folder):
+            return keys
+        # scandir entries carry the file type from the directory listing,
+        # so is_file() needs no extra stat() per entry like Path.iterdir
+        with os.scandir(self.destination_folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        keys.add(self._canonical(entry.path))
+                except (OSError, PermissionError):
+                    continue
+        return keys
+
     def _initialize_existing_files(self):
         """Mark all existing files as already processed to avoid re-processing"""
         try:
-            dest_path = Path(self.destination_folder).resolve()
-            if dest_path.exists():
-                existing_files = set()
-                for file_path in dest_path.iterdir():
-                    if file_path.is_file():
-                        try:
-                            existing_files.add(str(file_path.resolve()))
-                        except (OSError, PermissionError):
-                            continue
-                
-                with self.lock:
-                    self.processed_files.update(existing_files)
-                    logger.info(f"Initialized: {len(existing_files)} existing files will be ignored")
+            existing_files = self._scan_destination_keys()
+            with self.lock:
+                self.processed_files.update(existing_files)
+                logger.info("Initialized: %s existing files will be ignored", len(existing_files))
         except Exception as e:
-            logger.warning(f"Error initializing existing files: {e}")
-    
+            logger.warning("Error initializing existing files: %s", e)
+
     def on_created(self, event: FileSystemEvent):
-        """Called when a new file is created"""
-        if event.is_directory:
-            return
-        
-        file_path = Path(event.src_path)
-        
-        # Check if it's an image file
-        if not self._is_image_file(file_path):
-            return
-        
-        logger.debug(f"New file detected: {file_path.name}")
-        
+        """Called when a new image file is created (pattern-filtered by watchdog)"""
+        logger.debug("New file detected: %s", event.src_path)
+
+        file_key = self._canonical(event.src_path)
         with self.lock:
-            if str(file_path.resolve()) not in self.processed_files:
-                self.pending_files[str(file_path.resolve())] = time.time()
-    
+            if file_key not in self.processed_files:
+                self.pending_files[file_key] = time.time()
+                self._pending_event.set()
+
     def on_moved(self, event: FileSystemEvent):
-        """Called when a file is moved/renamed"""
-        if event.is_directory:
-            return
-        
+        """Called when an image file is moved/renamed (pattern-filtered by watchdog)"""
         # event.dest_path is the new location after move
-        file_path = Path(event.dest_path)
-        
-        # Check if it's in our destination folder
-        dest_path = Path(self.destination_folder).resolve()
-        if file_path.parent.resolve() != dest_path:
+        file_key = self._canonical(event.dest_path)
+
+        # Check if it's in our destination folder (string comparison on
+        # canonical keys - no resolve() syscalls)
+        if os.path.dirname(file_key) != self._destination_key:
             return
-        
-        # Check if it's an image file
-        if not self._is_image_file(file_path):
+
+        # A move can match on src_path alone (e.g. image renamed to a temp
+        # name), so re-check the destination suffix
+        if os.path.splitext(file_key)[1].lower() not in self._known_image_suffixes:
             return
-        
-        logger.debug(f"File moved to destination: {file_path.name}")
-        
+
+        logger.debug("File moved to destination: %s", event.dest_path)
+
         with self.lock:
-            if str(file_path.resolve()) not in self.processed_files:
-                self.pending_files[str(file_path.resolve())] = time.time()
-    
-    def _is_image_file(self, file_path: Path) -> bool:
-        """Check if file is a supported image file"""
-        ext = file_path.suffix.lower()
-        
-        raw_extensions = [
-            ext.lower() for ext in self.config.get('supported_extensions', {}).get('raw', [])
-        ]
-        standard_extensions = [
-            ext.lower() for ext in self.config.get('supported_extensions', {}).get('standard', [])
-        ]
-        all_extensions = raw_extensions + standard_extensions
-        
-        return ext in all_extensions
-    
+            if file_key not in self.processed_files:
+                self.pending_files[file_key] = time.time()
+                self._pending_event.set()
+
     def _debounce_worker(self):
-        """Worker thread that processes files after debounce period"""
+        """
+        Worker thread that processes files after the debounce period.
+        Event-driven: sleeps until the earliest pending deadline (or indefinitely
+        when nothing is pending) instead of waking every 500ms, so an idle booth
+        costs no wakeups and a new file is handed off right when its debounce
+        window closes.
+        """
         while True:
-            time.sleep(0.5)  # Check every 500ms
-            
+            with self.lock:
+                if self.pending_files:
+                    next_deadline = min(self.pending_files.values()) + self.debounce_seconds
+                else:
+                    next_deadline = None
+                self._pending_event.clear()
+
+            if next_deadline is None:
+                # Nothing pending - block until an event handler adds a file
+                self._pending_event.wait()
+                continue
+
+            wait_time = next_deadline - time.time()
+            if wait_time > 0:
+                # Wake early if a new file arrives (it can't shorten the deadline,
+                # but we need to re-arm the event before the next sleep)
+                self._pending_event.wait(timeout=wait_time)
+
             current_time = time.time()
             files_to_process = []
-            
+
             with self.lock:
                 # Check which files are ready to process
                 for file_path, timestamp in list(self.pending_files.items()):
@@ -126,11 +372,15 @@ class LightroomDestinationHandler(FileSystemEventHandler):
                             files_to_process.append(file_path)
                             self.processed_files.add(file_path)
                         del self.pending_files[file_path]
-            
+
             # Queue files for processing
+            self._journal_append(files_to_process)
             for file_path in files_to_process:
                 self.processor_queue.put(file_path)
 
+            # Opportunistically expire old processed entries (rate-limited)
+            self.processed_files.prune()
+
 
 class LightroomDestinationWatcher:
     """Watch Lightroom destination folder and move processed images back to original folders"""
@@ -141,11 +391,11 @@ class LightroomDestinationWatcher:
         self.processing_counter = processing_counter
         
         if not self.destination_folder.exists():
-            logger.warning(f"Lightroom destination folder does not exist, creating: {destination_folder}")
+            logger.warning("Lightroom destination folder does not exist, creating: %s", destination_folder)
             self.destination_folder.mkdir(parents=True, exist_ok=True)
         
-        # Processing queue
-        self.processor_queue = Queue()
+        # Processing queue (lock-free put path; see DequeChannel)
+        self.processor_queue = DequeChannel()
         
         # Event handler
         self.event_handler = LightroomDestinationHandler(
@@ -155,8 +405,9 @@ class LightroomDestinationWatcher:
             str(watch_folder)  # Keep for API compatibility but not used
         )
         
-        # Observer
-        self.observer = Observer()
+        # Observer (native OS notifications by default; config can select the
+        # polling backend for network shares - see create_observer)
+        self.observer = create_observer(config)
         self.observer.schedule(
             self.event_handler,
             str(self.destination_folder),
@@ -167,10 +418,25 @@ class LightroomDestinationWatcher:
         self.processing_threads = []
         self.max_concurrent = config.get('processing', {}).get('max_concurrent_jobs', 2)
         self.running = False
+
+        # When the export folder and the output base share a volume, each move is
+        # a single rename syscall - extra worker threads only add lock contention,
+        # so run with one
+        if self.max_concurrent > 1 and _same_volume(str(self.destination_folder), str(normalize_path(config.get('output_base_folder', '../output')))):
+            logger.info("Destination and output folders share a volume; using a single move worker")
+            self.max_concurrent = 1
+
+        # Hoisted config lookups - _process_file runs per exported image and
+        # these values never change after startup
+        self.separator = config.get('filename_separator', '___')
+        self.output_base_str = config.get('output_base_folder', '../output')
+        self.output_base = normalize_path(self.output_base_str)
+        self.output_subfolder = config.get('output_folder', 'processed')
+
     
     def start(self):
         """Start watching for new files"""
-        logger.info(f"Starting Lightroom destination watcher on: {self.destination_folder}")
+        logger.info("Starting Lightroom destination watcher on: %s", self.destination_folder)
         
         # Start observer
         self.observer.start()
@@ -188,35 +454,34 @@ class LightroomDestinationWatcher:
         """Stop watching"""
         logger.info("Stopping Lightroom destination watcher...")
         self.running = False
-        
+
         # Stop observer
         self.observer.stop()
         self.observer.join()
-        
-        # Wait for processing threads to finish current jobs
+
+        # Wake each worker with a sentinel, then wait for them to finish
+        for _ in self.processing_threads:
+            self.processor_queue.put(_SHUTDOWN)
         for thread in self.processing_threads:
             thread.join(timeout=5)
-        
+
         logger.info("Lightroom destination watcher stopped")
-    
+
     def _processing_worker(self):
         """Worker thread that processes files from the queue"""
-        while self.running:
+        while True:
             try:
-                # Get file from queue (with timeout to allow checking running flag)
-                try:
-                    file_path = self.processor_queue.get(timeout=1)
-                except:
-                    continue
-                
+                # Block until a file (or the shutdown sentinel) arrives - no
+                # wake-every-second polling of the running flag
+                file_path = self.processor_queue.get()
+                if file_path is _SHUTDOWN:
+                    break
+
                 # Process the file
                 self._process_file(file_path)
-                
-                # Mark task as done
-                self.processor_queue.task_done()
-            
+
             except Exception as e:
-                logger.error(f"Error in processing worker: {e}", exc_info=True)
+                logger.error("Error in processing worker: %s", e, exc_info=True)
     
     def _process_file(self, file_path: str):
         """Process a single file: extract folder name and move to output folder"""
@@ -224,93 +489,54 @@ class LightroomDestinationWatcher:
             file_path_obj = Path(file_path)
             
             if not file_path_obj.exists():
-                logger.warning(f"File no longer exists: {file_path}")
+                logger.warning("File no longer exists: %s", file_path)
                 return
             
             filename = file_path_obj.name
-            logger.info(f"Processing file: {filename}")
+            logger.info("Processing file: %s", filename)
             
             # Extract folder name from filename (format: folder_name___original_filename.ext)
-            # Use configured separator to reliably separate folder name from filename
-            separator = self.config.get('filename_separator', '___')
-            
-            if separator not in filename:
-                logger.warning(f"Filename does not contain folder prefix separator '{separator}': {filename}")
+            # partition scans the name once, instead of an "in" check followed by split
+            folder_name, sep, original_filename = filename.partition(self.separator)
+            if not sep:
+                logger.warning("Filename does not contain folder prefix separator '%s': %s", self.separator, filename)
                 return
             
-            # Split on separator (should only appear once)
-            parts = filename.split(separator, 1)
-            if len(parts) != 2:
-                logger.warning(f"Filename does not contain exactly one separator '{separator}': {filename}")
-                return
-            
-            folder_name = parts[0]
-            original_filename = parts[1]
-            
-            # Get output base folder from config (normalize Windows paths)
-            from folder_watcher import normalize_path
-            import os
-            output_base_str = self.config.get('output_base_folder', '../output')
-            output_base = normalize_path(output_base_str)
-            
-            logger.debug(f"Output base folder: {output_base} (normalized from: {output_base_str})")
-            
-            # Check if folder already exists (checked at startup)
-            output_base_exists = self.config.get('_output_base_exists', False)
-            
-            if output_base_exists:
-                # Folder exists, just verify accessibility
-                try:
-                    list(output_base.iterdir())
-                    logger.debug(f"Output base folder exists and is accessible: {output_base}")
-                except (OSError, PermissionError) as e:
-                    logger.error(f"Output base folder exists but is not accessible: {e}")
-                    logger.error(f"Original path string: {output_base_str}")
-                    return
-            else:
-                # Folder doesn't exist, try to create it
-                # Check if path is a root drive (e.g., "Z:\") - skip mkdir on root, but allow subdirectories
-                output_base_path_str = str(output_base)
-                is_root_drive = os.name == 'nt' and len(output_base_path_str) == 3 and output_base_path_str[1] == ':' and output_base_path_str[2] == '\\'
-                
-                if not is_root_drive:
-                    # Not a root drive, try to create the base folder
-                    try:
-                        # output_base.mkdir(parents=True, exist_ok=True)
-                        logger.debug(f"Output base folder created: {output_base}")
-                    except (OSError, PermissionError) as e:
-                        logger.error(f"Cannot create output folder {output_base}: {e}")
-                        logger.error(f"Original path string: {output_base_str}")
-                        return
-                else:
-                    # Root drive - verify it exists/accessible by trying to list it
-                    # Don't try to create it (can't create root drive)
-                    try:
-                        # Try to access the root drive by checking if we can list it
-                        list(output_base.iterdir())
-                        logger.debug(f"Root drive {output_base} is accessible")
-                    except (OSError, PermissionError) as e:
-                        logger.error(f"Root drive {output_base} is not accessible: {e}")
-                        logger.error(f"Original path string: {output_base_str}")
-                        logger.error(f"Please ensure the drive is mapped and accessible, or use a subdirectory like 'Z:/output'")
-                        return
-            
+            # Output base folder is normalized once at startup (see __init__)
+            output_base_str = self.output_base_str
+            output_base = self.output_base
+
+            logger.debug("Output base folder: %s (normalized from: %s)", output_base, output_base_str)
+
+            # No accessibility probe here: enumerating the whole output tree per
+            # exported file is the dominant syscall cost, and the makedirs below
+            # already is the existence test (it fails loudly if the drive is gone)
             # Create output folder structure: output_base/folder_name/processed/
-            output_folder = output_base / folder_name / self.config.get('output_folder', 'processed')
-            output_folder.mkdir(parents=True, exist_ok=True)
+            output_folder = output_base / folder_name / self.output_subfolder
+            _ensure_output_folder(str(output_folder))
             
             # Destination path
             destination = output_folder / original_filename
-            
-            # Move file to destination
-            shutil.move(str(file_path_obj), str(destination))
-            
-            logger.info(f"Moved {filename} -> {destination}")
+
+            # Move file to destination: plain rename first (one syscall when the
+            # Lightroom export folder and the output folder are on the same
+            # volume), shutil.move only for cross-device destinations
+            try:
+                _move_to_output(str(file_path_obj), str(destination))
+            except OSError:
+                # The cached output folder may have been deleted mid-run
+                # (cleanup rmtree, operator clearing the drive); drop the mkdir
+                # cache, recreate the folder and retry once
+                _ensure_output_folder.cache_clear()
+                _ensure_output_folder(str(output_folder))
+                _move_to_output(str(file_path_obj), str(destination))
+
+            logger.info("Moved %s -> %s", filename, destination)
             
             # Decrement processing counter (image moved to output)
             count = self.processing_counter.decrement(folder_name)
-            logger.debug(f"Processing counter for {folder_name}: {count}/{self.processing_counter.threshold}")
+            logger.debug("Processing counter for %s: %s/%s", folder_name, count, self.processing_counter.threshold)
             
         except Exception as e:
-            logger.error(f"Error processing file {file_path}: {e}", exc_info=True)
+            logger.error("Error processing file %s: %s", file_path, e, exc_info=True)
 
@@ -5,115 +5,21 @@ Main application entry point
 """
 
 import sys
+import os
 import signal
 import logging
-import yaml
+from threading import Event
 from pathlib import Path
-from colorama import init, Fore, Style
+
+from app_bootstrap import setup_logging, load_config
+from console_colors import enable_vt_mode, Fore, Style
 from folder_watcher import FolderWatcher
 from lightroom_destination_watcher import LightroomDestinationWatcher
 from cleanup_old_images import ImageCleanup
 from processing_counter import ProcessingCounter
 
-# Initialize colorama for colored console output
-init(autoreset=True)
-
-
-def setup_logging(config: dict):
-    """Setup logging configuration"""
-    log_config = config.get('logging', {})
-    log_level = getattr(logging, log_config.get('level', 'INFO').upper())
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Setup file handler
-    log_file = log_config.get('file', 'preset_processor.log')
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(formatter)
-    
-    # Setup console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_handler.setFormatter(formatter)
-    
-    # Setup root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.addHandler(file_handler)
-    
-    if log_config.get('console', True):
-        root_logger.addHandler(console_handler)
-
-
-def resolve_path(path_str: str, base_dir: Path) -> Path:
-    """
-    Resolve a path string to an absolute Path.
-    If the path is relative, it's resolved relative to base_dir.
-    If the path is absolute, it's used as-is.
-    
-    Args:
-        path_str: Path string (can be absolute or relative)
-        base_dir: Base directory for resolving relative paths
-        
-    Returns:
-        Resolved absolute Path
-    """
-    path = Path(path_str)
-    
-    # If path is already absolute, return it as-is
-    if path.is_absolute():
-        return path
-    
-    # Otherwise, resolve relative to base_dir
-    return (base_dir / path).resolve()
-
-
-def load_config(config_path: str = 'config.yaml') -> dict:
-    """Load configuration from YAML file"""
-    config_file = Path(config_path).resolve()
-    
-    if not config_file.exists():
-        print(f"{Fore.RED}Error: Configuration file not found: {config_path}")
-        print(f"{Fore.YELLOW}Please create a config.yaml file. See README.md for details.")
-        sys.exit(1)
-    
-    # Get the directory containing the config file (for resolving relative paths)
-    config_dir = config_file.parent
-    
-    try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        # Validate required settings
-        required_keys = ['watch_folder']
-        for key in required_keys:
-            if key not in config:
-                print(f"{Fore.RED}Error: Missing required configuration: {key}")
-                sys.exit(1)
-        
-        # Resolve paths (support both absolute and relative)
-        if 'watch_folder' in config:
-            config['watch_folder'] = str(resolve_path(config['watch_folder'], config_dir))
-        
-        if 'lightroom_watched_folder' in config:
-            config['lightroom_watched_folder'] = str(resolve_path(config['lightroom_watched_folder'], config_dir))
-        
-        if 'lightroom_destination_folder' in config:
-            config['lightroom_destination_folder'] = str(resolve_path(config['lightroom_destination_folder'], config_dir))
-        
-        return config
-    
-    except yaml.YAMLError as e:
-        print(f"{Fore.RED}Error: Failed to parse configuration file: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"{Fore.RED}Error: Failed to load configuration: {e}")
-        sys.exit(1)
+# Enable ANSI escape processing (no-op outside Windows)
+enable_vt_mode()
 
 
 def main():
@@ -213,31 +119,29 @@ def main():
         print(f"{Fore.YELLOW}Warning: Image cleanup failed to start: {e}")
         cleanup = None
     
-    # Setup signal handlers for graceful shutdown
+    # Setup signal handlers for graceful shutdown: the handler just flips one
+    # event the main thread is blocked on (watcher cleanup runs in `finally`)
+    shutdown_event = Event()
+
     def signal_handler(sig, frame):
         print(f"\n{Fore.YELLOW}Shutting down...{Style.RESET_ALL}")
         logger.info("Received shutdown signal")
-        watcher.stop()
-        destination_watcher.stop()
-        if cleanup:
-            cleanup.stop()
-        sys.exit(0)
-    
+        shutdown_event.set()
+
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    
+
     # Start watchers
     try:
         watcher.start()
         destination_watcher.start()
-        
+
         # Keep main thread alive
         print(f"{Fore.CYAN}Application running. Press Ctrl+C to stop.{Style.RESET_ALL}\n")
-        
-        # Wait for processing threads
-        for thread in watcher.processing_threads + destination_watcher.processing_threads:
-            thread.join()
-        
+
+        # Block on a single event instead of joining every worker thread in turn
+        shutdown_event.wait()
+
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Interrupted by user{Style.RESET_ALL}")
         logger.info("Interrupted by user")
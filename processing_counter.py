@@ -4,7 +4,7 @@ Shared counter mechanism to track number of images being processed per folder
 """
 
 import logging
-from threading import Lock
+from threading import Lock, Event
 from typing import Dict
 from collections import deque
 
@@ -14,18 +14,28 @@ logger = logging.getLogger(__name__)
 class ProcessingCounter:
     """Thread-safe counter to track processing status per folder"""
     
-    def __init__(self, threshold: int = 5):
+    def __init__(self, threshold: int = 5, pending_maxlen: int = None):
         """
         Initialize processing counter
-        
+
         Args:
             threshold: Maximum number of images that can be processed concurrently per folder
+            pending_maxlen: Maximum pending items held per folder before callers
+                are told to back off (defaults to threshold * 8)
         """
         self.threshold = threshold
+        self.pending_maxlen = pending_maxlen if pending_maxlen is not None else threshold * 8
         self.counters: Dict[str, int] = {}  # folder_name -> counter
         self.pending_queues: Dict[str, deque] = {}  # folder_name -> queue of pending items
+        # The lock only guards mutations. Reads (can_process/get_count) go through
+        # dict.get without it: single dict lookups are atomic under the GIL, and a
+        # slightly stale read is harmless because workers re-check before queueing.
         self.lock = Lock()
-    
+        # Set whenever a decrement frees capacity for a folder that has pending
+        # items, so the pending processor can react immediately instead of
+        # discovering it on its next polling sweep
+        self.capacity_event = Event()
+
     def increment(self, folder_name: str) -> int:
         """
         Increment counter for a folder (when image sent to lightroom)
@@ -36,13 +46,13 @@ class ProcessingCounter:
         Returns:
             New counter value
         """
+        # Read-modify-write still needs the lock (no atomic integers in CPython),
+        # but the critical section is just the arithmetic - logging happens outside
         with self.lock:
-            if folder_name not in self.counters:
-                self.counters[folder_name] = 0
-            self.counters[folder_name] += 1
-            count = self.counters[folder_name]
-            logger.debug(f"Counter incremented for {folder_name}: {count}/{self.threshold}")
-            return count
+            count = self.counters.get(folder_name, 0) + 1
+            self.counters[folder_name] = count
+        logger.debug("Counter incremented for %s: %s/%s", folder_name, count, self.threshold)
+        return count
     
     def decrement(self, folder_name: str) -> int:
         """
@@ -56,52 +66,78 @@ class ProcessingCounter:
         """
         with self.lock:
             if folder_name not in self.counters:
-                logger.warning(f"Attempted to decrement counter for unknown folder: {folder_name}")
-                return 0
-            
-            if self.counters[folder_name] > 0:
-                self.counters[folder_name] -= 1
+                unknown = True
+                count = 0
+                underflow = False
             else:
-                logger.warning(f"Counter for {folder_name} was already 0, cannot decrement")
-            
-            count = self.counters[folder_name]
-            logger.debug(f"Counter decremented for {folder_name}: {count}/{self.threshold}")
-            
-            # If counter dropped below threshold, process pending items
-            if count < self.threshold and folder_name in self.pending_queues:
-                pending_queue = self.pending_queues[folder_name]
-                if pending_queue:
-                    logger.info(f"Counter for {folder_name} dropped to {count}, processing {len(pending_queue)} pending image(s)")
-            
-            return count
+                unknown = False
+                count = self.counters[folder_name]
+                underflow = count <= 0
+                if not underflow:
+                    count -= 1
+                    self.counters[folder_name] = count
+            pending_count = len(self.pending_queues.get(folder_name, ()))
+
+        if unknown:
+            logger.warning("Attempted to decrement counter for unknown folder: %s", folder_name)
+            return 0
+
+        if underflow:
+            logger.warning("Counter for %s was already 0, cannot decrement", folder_name)
+
+        logger.debug("Counter decremented for %s: %s/%s", folder_name, count, self.threshold)
+
+        # If counter dropped below threshold, wake the pending processor
+        if count < self.threshold and pending_count:
+            logger.info("Counter for %s dropped to %s, processing %s pending image(s)", folder_name, count, pending_count)
+            self.capacity_event.set()
+
+        return count
     
     def can_process(self, folder_name: str) -> bool:
         """
         Check if a new image can be processed (counter < threshold)
-        
+
         Args:
             folder_name: Name of the folder
-            
+
         Returns:
             True if can process, False if should wait
         """
-        with self.lock:
-            if folder_name not in self.counters:
-                self.counters[folder_name] = 0
-            return self.counters[folder_name] < self.threshold
-    
+        # Lock-free fast path: this runs once per image per worker, and a plain
+        # dict.get is an atomic read under the GIL
+        return self.counters.get(folder_name, 0) < self.threshold
+
     def get_count(self, folder_name: str) -> int:
         """Get current counter value for a folder"""
-        with self.lock:
-            return self.counters.get(folder_name, 0)
+        return self.counters.get(folder_name, 0)
     
-    def add_pending(self, folder_name: str, item):
-        """Add item to pending queue for a folder"""
+    def add_pending(self, folder_name: str, item) -> bool:
+        """
+        Add item to pending queue for a folder.
+
+        Returns:
+            True if the item was queued, False if the folder's pending queue is
+            at capacity (caller should back off and retry once capacity frees up)
+        """
         with self.lock:
             if folder_name not in self.pending_queues:
-                self.pending_queues[folder_name] = deque()
-            self.pending_queues[folder_name].append(item)
-            logger.debug(f"Added pending item for {folder_name}, queue size: {len(self.pending_queues[folder_name])}")
+                self.pending_queues[folder_name] = deque(maxlen=self.pending_maxlen)
+            pending_queue = self.pending_queues[folder_name]
+            # An unbounded append would silently eat RAM under a stuck
+            # downstream; refusing here pushes back-pressure onto the caller
+            if len(pending_queue) == pending_queue.maxlen:
+                full = True
+            else:
+                full = False
+                pending_queue.append(item)
+                queue_size = len(pending_queue)
+
+        if full:
+            logger.warning("Pending queue full for %s (%s items), rejecting item", folder_name, self.pending_maxlen)
+            return False
+        logger.debug("Added pending item for %s, queue size: %s", folder_name, queue_size)
+        return True
     
     def get_pending(self, folder_name: str):
         """Get next pending item from queue (returns None if queue is empty)"""
@@ -112,9 +148,37 @@ class ProcessingCounter:
     
     def has_pending(self, folder_name: str) -> bool:
         """Check if there are pending items for a folder"""
-        with self.lock:
-            return folder_name in self.pending_queues and len(self.pending_queues[folder_name]) > 0
+        # Lock-free read: dict.get and len(deque) are each atomic, and callers
+        # re-check via get_pending (which returns None if drained concurrently)
+        pending_queue = self.pending_queues.get(folder_name)
+        return pending_queue is not None and len(pending_queue) > 0
     
+    def drain_processable(self, folder_names):
+        """
+        Pop every pending item that fits under the threshold, for all given
+        folders, in a single lock acquisition.
+
+        Per folder, at most (threshold - current count) items are drained so the
+        caller can process them all without re-checking capacity per item.
+
+        Args:
+            folder_names: Iterable of folder names to drain
+
+        Returns:
+            List of pending items ready to process
+        """
+        drained = []
+        with self.lock:
+            for folder_name in folder_names:
+                pending_queue = self.pending_queues.get(folder_name)
+                if not pending_queue:
+                    continue
+                capacity = self.threshold - self.counters.get(folder_name, 0)
+                while capacity > 0 and pending_queue:
+                    drained.append(pending_queue.popleft())
+                    capacity -= 1
+        return drained
+
     def remove_folder(self, folder_name: str):
         """Remove folder from tracking (when folder is deleted)"""
         with self.lock:
@@ -124,5 +188,5 @@ class ProcessingCounter:
                 pending_count = len(self.pending_queues[folder_name])
                 del self.pending_queues[folder_name]
                 if pending_count > 0:
-                    logger.warning(f"Removed folder {folder_name} with {pending_count} pending items")
+                    logger.warning("Removed folder %s with %s pending items", folder_name, pending_count)
 